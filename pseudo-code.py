@@ -1,25 +1,42 @@
-def set_flags():
-	try:
-	for index, row in path_df.iterrows():
-		if row['steering']   == rs.Steering.LEFT:  steering_char = 'R'
-                elif row['steering'] == rs.Steering.RIGHT: steering_char = 'L'
-                else: steering_char = 'N'
-
-            	gear_char = 'F' if row['gear'] == rs.Gear.FORWARD else ('B' if row['gear'] == rs.Gear.BACKWARD else 'N')
-
-		…
-
-while not end of DataFrame
-
-response_line = uart_comm.serial_port.readline().decode('ascii', errors='ignore').strip()
-
-if response_line == "1":
-	set_flags()
-	uart_comm.send_command(
-        steering=steering_char,
-        gear=gear_char,
-	duration=duration_ms_int,
-	lifting=lifting
-        )
-else: break
+STEERING_CHARS = {rs.Steering.LEFT: 'R', rs.Steering.RIGHT: 'L'}
+GEAR_CHARS = {rs.Gear.FORWARD: 'F', rs.Gear.BACKWARD: 'B'}
+NON_ASCII = bytes(range(0x80, 0x100))
+
+def command_chars():
+	steering_chars = path_df['steering'].map(STEERING_CHARS).fillna('N')
+	gear_chars = path_df['gear'].map(GEAR_CHARS).fillna('N')
+	return steering_chars, gear_chars
+
+rx_buf = bytearray()
+
+def read_line():
+	# read all pending bytes per call; on timeout return the partial buffer
+	timeout = serial.serialutil.Timeout(uart_comm.serial_port.timeout)
+	while b'\n' not in rx_buf:
+		chunk = uart_comm.serial_port.read(uart_comm.serial_port.in_waiting or 1)
+		if not chunk:
+			break
+		rx_buf.extend(chunk)
+		if timeout.expired():
+			break
+	line, _, rest = rx_buf.partition(b'\n')
+	rx_buf[:] = rest
+	return bytes(line)
+
+steering_chars, gear_chars = command_chars()
+commands = pd.concat([steering_chars, gear_chars, path_df['duration_ms'].astype(int)], axis=1)
+
+for steering_char, gear_char, duration_ms_int in commands.itertuples(index=False, name=None):
+
+	# drop non-ASCII noise such as \xff on UART power-up
+	response_line = read_line().translate(None, NON_ASCII).strip()
+
+	if response_line == b"1":
+		uart_comm.send_command(
+	        steering=steering_char,
+	        gear=gear_char,
+		duration=duration_ms_int,
+		lifting=lifting
+	        )
+	else: break
 